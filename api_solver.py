@@ -1,21 +1,26 @@
 import os
 import sys
 import time
-import json
 import uuid
 import argparse
-import random
-import string
+import secrets
 import asyncio
+import orjson
 
-from quart import Quart, request, jsonify
+import hypercorn
+import hypercorn.asyncio
+from quart import Quart, Response, request, jsonify
 from typing import Dict, Optional
 from dataclasses import dataclass
-from patchright.async_api import async_playwright, Page, BrowserContext
+from patchright.async_api import async_playwright, Page, BrowserContext, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 from camoufox.async_api import AsyncCamoufox
 from logmagix import Loader
 from collections import deque
-from functools import wraps
+from contextlib import asynccontextmanager
+from cachetools import TTLCache
+from functools import wraps, lru_cache
+from urllib.parse import urlsplit
+from .event_loop import install_uvloop
 from .logger import log
 
 DEBUG = False
@@ -60,20 +65,82 @@ class TurnstileAPIServer:
     </body>
     </html>
     """
+    _HTML_PRE, _HTML_POST = HTML_TEMPLATE.split("<!-- cf turnstile -->")
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+    RESULTS_MAXSIZE = 100_000
+    RESULTS_TTL = 3600
+    _INDEX_HTML = """
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Turnstile Solver API</title>
+        <script src="https://cdn.tailwindcss.com"></script>
+    </head>
+    <body class="bg-gray-900 text-gray-200 min-h-screen flex items-center justify-center">
+        <div class="bg-gray-800 p-8 rounded-lg shadow-md max-w-2xl w-full border border-red-500">
+            <h1 class="text-3xl font-bold mb-6 text-center text-red-500">Welcome to Turnstile Solver API</h1>
+
+            <p class="mb-4 text-gray-300">To use the turnstile service, send a GET request to 
+               <code class="bg-red-700 text-white px-2 py-1 rounded">/turnstile</code> with the following query parameters:</p>
+
+            <ul class="list-disc pl-6 mb-6 text-gray-300">
+                <li><strong>url</strong>: The URL where Turnstile is to be validated</li>
+                <li><strong>sitekey</strong>: The site key for Turnstile</li>
+                <li><strong>action</strong>: (Optional) Custom action parameter</li>
+                <li><strong>cdata</strong>: (Optional) Custom data parameter</li>
+                <li><strong>invisible</strong>: (Optional) Set to 'true' for invisible captchas</li>
+            </ul>
+
+            <div class="bg-gray-700 p-4 rounded-lg mb-6 border border-red-500">
+                <p class="font-semibold mb-2 text-red-400">Example usage:</p>
+                <code class="text-sm break-all text-red-300">/turnstile?url=https://example.com&sitekey=sitekey&invisible=true</code>
+            </div>
+            
+            <div class="bg-gray-700 p-4 rounded-lg mb-6 border border-red-500">
+                <p class="font-semibold mb-2 text-red-400">Then check the result with:</p>
+                <code class="text-sm break-all text-red-300">/result?id=your_task_id</code>
+                <p class="mt-2 text-sm text-gray-400">A finished result can only be retrieved once; it is removed after it is returned.</p>
+                <p class="mt-2 text-sm text-gray-400">Tasks are solved in the order they are submitted. When the queue is full, <code>/turnstile</code> returns 429.</p>
+            </div>
+
+            <div class="bg-red-900 border-l-4 border-red-600 p-4 mb-6">
+                <p class="text-red-200 font-semibold">This project is inspired by 
+                   <a href="https://github.com/Body-Alhoha/turnaround" class="text-red-300 hover:underline">Turnaround</a> 
+                   and is currently maintained by
+                   <a href="https://github.com/sexfrance" class="text-red-300 hover:underline">Sexfrance</a>.</p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
 
-    def __init__(self, headless: bool = False, useragent: str = None, debug: bool = False, browser_type: str = "chromium", thread: int = 1):
+    def __init__(self, headless: bool = False, useragent: str = None, debug: bool = False, browser_type: str = "chromium", thread: int = 1,
+                 max_pending: int = 1000):
         global DEBUG
         DEBUG = debug
         self.debug = debug
         self.app = Quart(__name__)
         self.log = log
         self.loader = Loader(desc="Solving captcha...", timeout=0.05)
-        self.results = self._load_results()
+        self.results = TTLCache(maxsize=self.RESULTS_MAXSIZE, ttl=self.RESULTS_TTL)
+        self.results.update(self._load_results())
         self.browser_type = browser_type
         self.headless = headless
         self.useragent = useragent
         self.thread_count = thread
+        self._user_data_root = f"{os.getcwd()}/tmp"
         self.browser_pool = asyncio.Queue()
+        self._spare_pool = asyncio.Queue()
+        self._background_tasks = set()
+        self._solve_tasks = set()
+        self.max_pending = max_pending
+        self.spare = 1
+        self.retire_after_pages = 200
+        self._results_dirty = asyncio.Event()
+        self._writer_stopping = False
+        self._flush_delay = 0.5
         self.browser_args = [
             "--disable-blink-features=AutomationControlled",
             "--no-sandbox",
@@ -95,23 +162,46 @@ class TurnstileAPIServer:
         """Load previous results from results.json."""
         try:
             if os.path.exists("results.json"):
-                with open("results.json", "r") as f:
-                    return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+                with open("results.json", "rb") as f:
+                    return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, IOError) as e:
             log.warning(f"Error loading results: {str(e)}. Starting with an empty results dictionary.")
         return {}
 
-    def _save_results(self):
-        """Save results to results.json."""
+    @staticmethod
+    def _write_results(results: dict):
+        """Write a results snapshot to results.json."""
         try:
-            with open("results.json", "w") as result_file:
-                json.dump(self.results, result_file, indent=4)
+            with open("results.json", "wb") as result_file:
+                result_file.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         except IOError as e:
             log.error(f"Error saving results to file: {str(e)}")
 
+    def _store_result(self, task_id: str, result: dict) -> None:
+        """Publish a finished result right away and schedule it to be persisted."""
+        self.results[task_id] = result
+        self._results_dirty.set()
+
+    async def _results_writer(self) -> None:
+        """Persist results.json after changes, coalescing everything stored within the flush window into one write."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._results_dirty.wait()
+            if not self._writer_stopping:
+                await asyncio.sleep(self._flush_delay)
+            self._results_dirty.clear()
+            try:
+                await loop.run_in_executor(None, self._write_results, dict(self.results))
+            except Exception as e:
+                log.error(f"Error saving results to file: {str(e)}")
+
+            if self._writer_stopping and not self._results_dirty.is_set():
+                return
+
     def _setup_routes(self) -> None:
         """Set up the application routes."""
         self.app.before_serving(self._startup)
+        self.app.after_serving(self._shutdown)
         self.app.route('/turnstile', methods=['GET'])(self.process_turnstile)
         self.app.route('/result', methods=['GET'])(self.get_result)
         self.app.route('/')(self.index)
@@ -119,134 +209,264 @@ class TurnstileAPIServer:
     async def _startup(self) -> None:
         """Initialize the browser and page pool on startup."""
         log.info("Starting browser initialization")
+        self._writer_task = asyncio.create_task(self._results_writer())
         try:
             await self._initialize_browser()
         except Exception as e:
             log.error(f"Failed to initialize browser: {str(e)}")
             raise
 
-    async def _initialize_browser(self) -> None:
-        """Initialize the browser and create the page pool."""
-        if self.browser_type == "chromium" or self.browser_type == "chrome" or self.browser_type == "msedge":
-            playwright = await async_playwright().start()
+    async def _shutdown(self) -> None:
+        """Cancel in-flight solves and let the results writer finish its last write."""
+        for task in self._solve_tasks | self._background_tasks:
+            task.cancel()
+        self._writer_stopping = True
+        self._results_dirty.set()
+        await self._writer_task
+
+    async def _install_page_route(self, page: Page) -> None:
+        """Install the single route handler that serves the Turnstile page and blocks heavy resources."""
+        page._turnstile_url = None
+        page._turnstile_body = None
+        blocked = self.BLOCKED_RESOURCE_TYPES
+
+        async def _dispatch(route):
+            if route.request.url == page._turnstile_url:
+                await route.fulfill(body=page._turnstile_body, status=200)
+            elif route.request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await page.route("**/*", _dispatch)
+
+    async def _launch_browser(self, index: int, user_data_dir: str = None) -> dict:
+        """Launch a browser context and return it as a pool entry, reusing user_data_dir if given."""
+        if self.browser_type == "chromium":
+            context = await self._browser.new_context()
+            page = await context.new_page()
+
+        elif self.browser_type in ("chrome", "msedge"):
+            reused = user_data_dir is not None
+            if not reused:
+                profile_prefix = "edge" if self.browser_type == "msedge" else self.browser_type
+                user_data_dir = f"{self._user_data_root}/turnstile-{profile_prefix}-{secrets.token_hex(5)}"
+            context = await self._playwright.chromium.launch_persistent_context(
+                user_data_dir=user_data_dir,
+                channel=self.browser_type,
+                headless=self.headless,
+                no_viewport=True,
+            )
+            if reused:
+                await context.clear_cookies()
+            page = context.pages[0]
+
         elif self.browser_type == "camoufox":
-            camoufox = AsyncCamoufox(headless=self.headless)
+            context = await self._camoufox.start()
+            page = await context.new_page()
 
-        for i in range(self.thread_count):
+        await self._install_page_route(page)
+        page._cdp = await page.context.new_cdp_session(page) if self.browser_type != "camoufox" else None
+
+        if self.debug:
+            log.success(f"Browser {index} initialized successfully")
+
+        return {"id": index, "context": context, "page": page, "pages_served": 0, "user_data_dir": user_data_dir}
+
+    async def _initialize_browser(self) -> None:
+        """Initialize the browser and create the context pool."""
+        if self.browser_type == "chromium" or self.browser_type == "chrome" or self.browser_type == "msedge":
+            self._playwright = await async_playwright().start()
             if self.browser_type == "chromium":
-                browser = await playwright.chromium.launch(
+                self._browser = await self._playwright.chromium.launch(
                     headless=self.headless,
                     args=self.browser_args
                 )
-                page = await browser.new_page()
+        elif self.browser_type == "camoufox":
+            self._camoufox = AsyncCamoufox(headless=self.headless)
 
-            elif self.browser_type == "chrome":
-                browser = await playwright.chromium.launch_persistent_context(
-                    user_data_dir=f"{os.getcwd()}/tmp/turnstile-chrome-{''.join(random.choices(string.ascii_letters + string.digits, k=10))}",
-                    channel="chrome",
-                    headless=self.headless,
-                    no_viewport=True,
-                )
-                page = browser.pages[0]
-                
-            elif self.browser_type == "msedge":
-                browser = await playwright.chromium.launch_persistent_context(
-                    user_data_dir=f"{os.getcwd()}/tmp/turnstile-edge-{''.join(random.choices(string.ascii_letters + string.digits, k=10))}",
-                    channel="msedge",
-                    headless=self.headless,
-                    no_viewport=True,
-                )
-                page = browser.pages[0]
+        for i in range(self.thread_count):
+            await self.browser_pool.put(await self._launch_browser(i + 1))
+
+        for i in range(self.spare):
+            await self._spare_pool.put(await self._launch_browser(self.thread_count + i + 1))
+
+        log.success(f"Browser pool initialized with {self.browser_pool.qsize()} browsers and {self._spare_pool.qsize()} spare")
+
+    @asynccontextmanager
+    async def _acquire_browser(self):
+        """Borrow a pool entry and always hand it back, even on cancellation."""
+        entry = await self.browser_pool.get()
+        try:
+            yield entry
+        finally:
+            await self._release_browser(entry)
+
+    async def _release_browser(self, entry: dict) -> None:
+        """Return a browser to the pool, swapping in a spare once it has served enough pages."""
+        entry["pages_served"] += 1
+        if entry["pages_served"] < self.retire_after_pages:
+            await self.browser_pool.put(entry)
+            return
+
+        try:
+            spare = self._spare_pool.get_nowait()
+        except asyncio.QueueEmpty:
+            spare = None
+
+        if spare is not None:
+            await self.browser_pool.put(spare)
+
+        task = asyncio.create_task(self._retire_browser(entry, refill_pool=spare is None))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _retire_browser(self, entry: dict, refill_pool: bool) -> None:
+        """Close a worn-out browser and warm up its replacement."""
+        if self.debug:
+            log.debug(f"Browser {entry['id']}: Retiring after {entry['pages_served']} pages")
 
-            elif self.browser_type == "camoufox":
-                browser = await camoufox.start()
-                page = await browser.new_page()
+        user_data_dir = entry["user_data_dir"]
+        try:
+            await entry["context"].close()
+        except Exception as e:
+            log.warning(f"Browser {entry['id']}: Error closing retired browser: {str(e)}")
+            user_data_dir = None
+
+        delay = 1
+        while True:
+            try:
+                replacement = await self._launch_browser(entry["id"], user_data_dir)
+                break
+            except Exception as e:
+                log.error(f"Browser {entry['id']}: Failed to launch replacement, retrying in {delay}s: {str(e)}")
+                user_data_dir = None
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60)
+
+        if refill_pool:
+            await self.browser_pool.put(replacement)
+        else:
+            await self._spare_pool.put(replacement)
 
-            await self.browser_pool.put((i+1, browser, page))
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _build_page(sitekey: str, action: str = None, cdata: str = None) -> bytes:
+        """Build the encoded Turnstile page HTML for the given widget parameters."""
+        return "".join((
+            TurnstileAPIServer._HTML_PRE,
+            f'<div class="cf-turnstile" data-sitekey="{sitekey}"'
+            + (f' data-action="{action}"' if action else '')
+            + (f' data-cdata="{cdata}"' if cdata else '')
+            + '></div>',
+            TurnstileAPIServer._HTML_POST,
+        )).encode("utf-8")
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_url(url: str) -> str:
+        """Return the URL with a trailing slash."""
+        return url + "/" if not url.endswith("/") else url
+
+    async def _wait_for_token(self, page: Page, index: int, invisible: bool, max_attempts: int = 10) -> Optional[str]:
+        """Return the page's Turnstile token, or None if the widget never mounts or never answers."""
+        attempts, timeout = (1, max_attempts * 500) if invisible else (max_attempts, 500)
+
+        try:
+            await page.wait_for_selector("[name=cf-turnstile-response]", state="attached", timeout=5000)
+        except PlaywrightTimeoutError:
             if self.debug:
-                log.success(f"Browser {i + 1} initialized successfully")
+                log.debug(f"Browser {index}: Turnstile widget did not mount")
+            return None
 
-        log.success(f"Browser pool initialized with {self.browser_pool.qsize()} browsers")
+        if not invisible:
+            await page.evaluate("document.querySelector('.cf-turnstile').style.width = '70px'")
+            await page.click(".cf-turnstile")
+
+        for attempt in range(attempts):
+            try:
+                handle = await page.wait_for_function(
+                    """() => {
+                        const el = document.querySelector('[name=cf-turnstile-response]');
+                        return el && el.value ? el.value : false;
+                    }""",
+                    timeout=timeout
+                )
+                return await handle.json_value()
+            except PlaywrightTimeoutError:
+                if self.debug:
+                    log.debug(f"Browser {index}: Attempt {attempt + 1}: No Turnstile response yet")
+                if not invisible and attempt + 1 < attempts:
+                    await page.click(".cf-turnstile")
+
+        return None
 
     async def _solve_turnstile(self, task_id: str, url: str, sitekey: str, action: str = None, cdata: str = None, invisible: bool = False):
         """Solve the Turnstile challenge."""
-        index, browser, page = await self.browser_pool.get()
-        start_time = time.time()
+        async with self._acquire_browser() as entry:
+            index, page = entry["id"], entry["page"]
+            start_time = time.time()
 
-        try:
-            if self.debug:
-                log.debug(f"Browser {index}: Starting Turnstile solve for URL: {url} with Sitekey: {sitekey}")
-                log.debug(f"Browser {index}: Setting up page data and route")
+            try:
+                if self.debug:
+                    log.debug(f"Browser {index}: Starting Turnstile solve for URL: {url} with Sitekey: {sitekey}")
+                    log.debug(f"Browser {index}: Setting up page data and route")
 
-            url_with_slash = url + "/" if not url.endswith("/") else url
-            turnstile_div = f'<div class="cf-turnstile" data-sitekey="{sitekey}"' + (f' data-action="{action}"' if action else '') + (f' data-cdata="{cdata}"' if cdata else '') + '></div>'
-            page_data = self.HTML_TEMPLATE.replace("<!-- cf turnstile -->", turnstile_div)
+                url_with_slash = self._normalize_url(url)
+                page_data = self._build_page(sitekey, action, cdata)
 
-            await page.route(url_with_slash, lambda route: route.fulfill(body=page_data, status=200))
-            await page.goto(url_with_slash)
+                page._turnstile_url, page._turnstile_body = url_with_slash, page_data
+                await page.goto(url_with_slash)
 
-            if self.debug:
-                log.debug(f"Browser {index}: Starting Turnstile response retrieval loop")
+                if self.debug:
+                    log.debug(f"Browser {index}: Waiting for Turnstile response")
 
-            for attempt in range(10):
-                try:
-                    turnstile_check = await page.eval_on_selector(
-                        "[name=cf-turnstile-response]",
-                        "el => el.value"
-                    )
-                    
-                    if turnstile_check == "":
-                        if self.debug:
-                            log.debug(f"Browser {index}: Attempt {attempt+1} - No Turnstile response yet")
-
-                        if not invisible:
-                            await page.evaluate("document.querySelector('.cf-turnstile').style.width = '70px'")
-                            await page.click(".cf-turnstile")
-                            
-                        await asyncio.sleep(0.5)
-                    else:
-                        element = await page.query_selector("[name=cf-turnstile-response]")
-                        if element:
-                            value = await element.get_attribute("value")
-                            elapsed_time = round(time.time() - start_time, 3)
-
-                            log.success(f"Browser {index}: Successfully solved captcha in {elapsed_time} seconds")
-
-                            self.results[task_id] = {"value": value, "elapsed_time": elapsed_time}
-                            self._save_results()
-                            break
-                except Exception as e:
-                    log.warning(f"Browser {index}: Error during attempt {attempt+1}: {str(e)}")
-                    await asyncio.sleep(0.5)
-                    continue
-
-            if self.results.get(task_id) == "CAPTCHA_NOT_READY":
-                elapsed_time = round(time.time() - start_time, 3)
-                self.results[task_id] = {"value": "CAPTCHA_FAIL", "elapsed_time": elapsed_time}
-                log.error(f"Browser {index}: Failed to solve Turnstile in {elapsed_time} seconds")
+                value = await self._wait_for_token(page, index, invisible)
+                if value:
+                    elapsed_time = round(time.time() - start_time, 3)
+
+                    log.success(f"Browser {index}: Successfully solved captcha in {elapsed_time} seconds")
+
+                    self._store_result(task_id, {"value": value, "elapsed_time": elapsed_time})
+                else:
+                    elapsed_time = round(time.time() - start_time, 3)
+                    self._store_result(task_id, {"value": "CAPTCHA_FAIL", "elapsed_time": elapsed_time})
+                    log.error(f"Browser {index}: Failed to solve Turnstile in {elapsed_time} seconds")
                 
-        except Exception as e:
-            elapsed_time = round(time.time() - start_time, 3)
-            self.results[task_id] = {"value": "CAPTCHA_FAIL", "elapsed_time": elapsed_time}
-            log.error(f"Browser {index}: Error solving Turnstile: {str(e)}")
+            except Exception as e:
+                elapsed_time = round(time.time() - start_time, 3)
+                self._store_result(task_id, {"value": "CAPTCHA_FAIL", "elapsed_time": elapsed_time})
+                log.error(f"Browser {index}: Error solving Turnstile: {str(e)}")
             
-        finally:
-            if self.debug:
-                log.debug(f"Browser {index}: Clearing page state")
+            finally:
+                if self.debug:
+                    log.debug(f"Browser {index}: Clearing page state")
                 
-            try:
-                await page.goto("about:blank")
-                await page.evaluate("""() => {
-                    try {
-                        window.localStorage.clear();
-                        window.sessionStorage.clear();
-                    } catch (e) {}
-                }""")
-            except:
-                pass
-                
-            await self.browser_pool.put((index, browser, page))
+                try:
+                    if page._cdp is not None:
+                        await page.evaluate("""() => {
+                            const widget = document.querySelector('.cf-turnstile');
+                            if (!widget) return;
+                            try { if (window.turnstile) window.turnstile.remove(widget); } catch (e) {}
+                            widget.remove();
+                        }""")
+                        if page._turnstile_url:
+                            parsed = urlsplit(page._turnstile_url)
+                            await page._cdp.send("Storage.clearDataForOrigin", {
+                                "origin": f"{parsed.scheme}://{parsed.netloc}",
+                                "storageTypes": "all"
+                            })
+                    else:
+                        await page.goto("about:blank")
+                        await page.evaluate("""() => {
+                            try {
+                                window.localStorage.clear();
+                                window.sessionStorage.clear();
+                            } catch (e) {}
+                        }""")
+                except PlaywrightError as e:
+                    if self.debug:
+                        log.debug(f"Browser {index}: Error clearing page state: {str(e)}")
 
     async def process_turnstile(self):
         """Handle the /turnstile endpoint requests."""
@@ -262,11 +482,17 @@ class TurnstileAPIServer:
                 "error": "Both 'url' and 'sitekey' are required"
             }), 400
 
-        task_id = str(uuid.uuid4())
+        if len(self._solve_tasks) >= self.max_pending:
+            return jsonify({
+                "status": "error",
+                "error": "Too many pending tasks, try again later"
+            }), 429
+
+        task_id = uuid.uuid4().hex
         self.results[task_id] = "CAPTCHA_NOT_READY"
 
         try:
-            asyncio.create_task(self._solve_turnstile(
+            task = asyncio.create_task(self._solve_turnstile(
                 task_id=task_id, 
                 url=url, 
                 sitekey=sitekey, 
@@ -274,6 +500,8 @@ class TurnstileAPIServer:
                 cdata=cdata,
                 invisible=invisible
             ))
+            self._solve_tasks.add(task)
+            task.add_done_callback(self._solve_tasks.discard)
 
             if self.debug:
                 log.debug(f"Request completed with taskid {task_id}.")
@@ -289,73 +517,35 @@ class TurnstileAPIServer:
         """Return solved data"""
         task_id = request.args.get('id')
 
-        if not task_id or task_id not in self.results:
+        try:
+            result = self.results[task_id]
+        except KeyError:
             return jsonify({"status": "error", "error": "Invalid task ID/Request parameter"}), 400
-
-        result = self.results[task_id]
         
         # If it's still processing
         if result == "CAPTCHA_NOT_READY":
             return jsonify({"status": "processing"}), 202
-            
+
+        self.results.pop(task_id, None)
+        self._results_dirty.set()
+
         status_code = 200
         if result.get('value') == "CAPTCHA_FAIL":
             status_code = 422
 
-        return jsonify(result), status_code
+        return Response(orjson.dumps(result), status=status_code, mimetype="application/json")
 
     @staticmethod
     async def index():
         """Serve the API documentation page."""
-        return """
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>Turnstile Solver API</title>
-                <script src="https://cdn.tailwindcss.com"></script>
-            </head>
-            <body class="bg-gray-900 text-gray-200 min-h-screen flex items-center justify-center">
-                <div class="bg-gray-800 p-8 rounded-lg shadow-md max-w-2xl w-full border border-red-500">
-                    <h1 class="text-3xl font-bold mb-6 text-center text-red-500">Welcome to Turnstile Solver API</h1>
-
-                    <p class="mb-4 text-gray-300">To use the turnstile service, send a GET request to 
-                       <code class="bg-red-700 text-white px-2 py-1 rounded">/turnstile</code> with the following query parameters:</p>
-
-                    <ul class="list-disc pl-6 mb-6 text-gray-300">
-                        <li><strong>url</strong>: The URL where Turnstile is to be validated</li>
-                        <li><strong>sitekey</strong>: The site key for Turnstile</li>
-                        <li><strong>action</strong>: (Optional) Custom action parameter</li>
-                        <li><strong>cdata</strong>: (Optional) Custom data parameter</li>
-                        <li><strong>invisible</strong>: (Optional) Set to 'true' for invisible captchas</li>
-                    </ul>
-
-                    <div class="bg-gray-700 p-4 rounded-lg mb-6 border border-red-500">
-                        <p class="font-semibold mb-2 text-red-400">Example usage:</p>
-                        <code class="text-sm break-all text-red-300">/turnstile?url=https://example.com&sitekey=sitekey&invisible=true</code>
-                    </div>
-                    
-                    <div class="bg-gray-700 p-4 rounded-lg mb-6 border border-red-500">
-                        <p class="font-semibold mb-2 text-red-400">Then check the result with:</p>
-                        <code class="text-sm break-all text-red-300">/result?id=your_task_id</code>
-                    </div>
-
-                    <div class="bg-red-900 border-l-4 border-red-600 p-4 mb-6">
-                        <p class="text-red-200 font-semibold">This project is inspired by 
-                           <a href="https://github.com/Body-Alhoha/turnaround" class="text-red-300 hover:underline">Turnaround</a> 
-                           and is currently maintained by
-                           <a href="https://github.com/sexfrance" class="text-red-300 hover:underline">Sexfrance</a>.</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-        """
+        return Response(_INDEX_HTML_BYTES, content_type="text/html; charset=utf-8")
 
     def create_app(self):
         """Create and configure the application instance."""
         return self.app
 
+_INDEX_HTML_BYTES = TurnstileAPIServer._INDEX_HTML.encode("utf-8")
+
 def parse_args():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="Turnstile API Server")
@@ -366,16 +556,18 @@ def parse_args():
     parser.add_argument('--thread', type=int, default=1, help='Number of browser threads')
     parser.add_argument('--host', type=str, default='127.0.0.1', help='Host IP address')
     parser.add_argument('--port', type=int, default=5000, help='Port to listen on')
+    parser.add_argument('--max_pending', type=int, default=1000, help='Maximum number of queued solves before /turnstile returns 429')
     return parser.parse_args()
 
-def create_app(headless=False, useragent=None, debug=False, browser_type="chromium", thread=1):
+def create_app(headless=False, useragent=None, debug=False, browser_type="chromium", thread=1, max_pending=1000):
     """Create the Quart application."""
     server = TurnstileAPIServer(
         headless=headless,
         useragent=useragent,
         debug=debug,
         browser_type=browser_type,
-        thread=thread
+        thread=thread,
+        max_pending=max_pending
     )
     return server.app
 
@@ -400,9 +592,16 @@ if __name__ == "__main__":
         useragent=args.useragent,
         debug=args.debug,
         browser_type=args.browser_type,
-        thread=args.thread
+        thread=args.thread,
+        max_pending=args.max_pending
     )
-    app.run(host=args.host, port=args.port)
+
+    install_uvloop()
+
+    # Each hypercorn worker would start its own browser pool, so a single worker is served here
+    config = hypercorn.Config()
+    config.bind = [f"{args.host}:{args.port}"]
+    asyncio.run(hypercorn.asyncio.serve(app, config))
 
 # Credits for the changes: github.com/sexfrance
 # Credit for the original script: github.com/Theyka
\ No newline at end of file
@@ -1,15 +1,18 @@
 import asyncio
+import hashlib
 import time
 import os
-import random
-import string
+import tempfile
+import weakref
 
-from typing import Dict, Optional
-from dataclasses import dataclass
-from patchright.async_api import async_playwright, Page, BrowserContext
+from typing import Dict, List, Optional
+from dataclasses import asdict, dataclass
+from patchright.async_api import async_playwright, Page, BrowserContext, TimeoutError as PlaywrightTimeoutError
 from camoufox.async_api import AsyncCamoufox
 from logmagix import Loader
-from functools import wraps
+from functools import wraps, lru_cache, cached_property
+from urllib.parse import urlsplit
+from .event_loop import install_uvloop
 from .logger import log
 
 DEBUG = False
@@ -32,7 +35,22 @@ def debug(func_or_message, *args, **kwargs):
         if DEBUG:
             log.debug(f"Debug: {func_or_message}")
 
-@dataclass
+PROFILES_ROOT = f"{os.getcwd()}/tmp"
+MAX_CONCURRENT_SOLVES = int(os.getenv("TURNSTILE_MAX_CONCURRENCY", "8"))
+_solve_semaphores = weakref.WeakKeyDictionary()
+
+BROWSER_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--window-position=2000,2000",
+)
+
+@dataclass(slots=True)
 class TurnstileResult:
     turnstile_value: Optional[str]
     elapsed_time_seconds: float
@@ -59,79 +77,258 @@ class AsyncTurnstileSolver:
     </html>
     """
 
-    def __init__(self, debug: bool = False, headless: Optional[bool] = False, useragent: Optional[str] = None, browser_type: str = "chromium"):
+    TOKEN_CACHE_TTL = 240
+    CACHE_POLICIES = ("enabled", "disabled", "read-only")
+    _token_cache: Dict[str, tuple] = {}
+    _free_profiles: Dict[str, List[str]] = {}
+
+    def __init__(self, debug: bool = False, headless: Optional[bool] = False, useragent: Optional[str] = None, browser_type: str = "chromium",
+                 cache_policy: str = "disabled", show_spinner: bool = False, navigation_timeout_ms: int = 15000,
+                 poll_timeout_ms: int = 10000):
+        if browser_type not in self._LAUNCHERS:
+            raise ValueError(f"Unknown browser type: {browser_type} Available browser types: {list(self._LAUNCHERS)}")
+        if cache_policy not in self.CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy: {cache_policy} Available cache policies: {list(self.CACHE_POLICIES)}")
+
         global DEBUG
         DEBUG = debug
         self.debug = debug
         self.browser_type = browser_type
         self.headless = headless
         self.useragent = useragent
-        self.log = log
-        self.loader = Loader(desc="Solving captcha...", timeout=0.05)
-        self.browser_args = [
-            "--disable-blink-features=AutomationControlled",
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-            "--disable-background-networking",
-            "--disable-background-timer-throttling",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-renderer-backgrounding",
-            "--window-position=2000,2000",
-        ]
-
-        if self.useragent:
-            self.browser_args.append(f"--user-agent={self.useragent}")
-            
-        if self.headless and not self.useragent:
-            self.log.warning("To solve captchas with headless mode you need to set the useragent!")
+        self.show_spinner = show_spinner
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+        self._profile_dir = None
+        self._contexts: Dict[tuple, BrowserContext] = {}
+        self._warm = False
+        self._active = 0
+        self._persistent_cookies = None
+        self.cache_policy = cache_policy
+        self.navigation_timeout_ms = navigation_timeout_ms
+        self.poll_timeout_ms = poll_timeout_ms
+        self.browser_args = BROWSER_ARGS + (f"--user-agent={self.useragent}",) if self.useragent else BROWSER_ARGS
 
-    @debug
-    async def _setup_page(self, browser, url: str, sitekey: str = None, action: str = None, cdata: str = None) -> Page:
+        if self.headless and not self.useragent:
+            log.warning("To solve captchas with headless mode you need to set the useragent!")
+
+    @cached_property
+    def loader(self) -> Loader:
+        """Spinner shown while solving, created on first use."""
+        return Loader(desc="Solving captcha...", timeout=0.05)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _render_html(sitekey: str, action: str = None, cdata: str = None) -> str:
+        """Render the Turnstile page HTML for the given widget parameters."""
+        attributes = [f'data-sitekey="{sitekey}"']
+        if action:
+            attributes.append(f'data-action="{action}"')
+        if cdata:
+            attributes.append(f'data-cdata="{cdata}"')
+        turnstile_div = f'<div class="cf-turnstile" {" ".join(attributes)} data-theme="light" style="width: 70px"></div>'
+        return AsyncTurnstileSolver.HTML_TEMPLATE.replace("<!-- cf turnstile -->", turnstile_div)
+
+    async def _setup_page(self, context: BrowserContext, url: str, sitekey: str = None, action: str = None, cdata: str = None) -> Page:
         """Set up the page with or without Turnstile widget."""
-        if self.browser_type == "chrome":
-            page = browser.pages[0]
-        else:
-            page = await browser.new_page()
-            
+        page = await context.new_page()
+
         url_with_slash = url + "/" if not url.endswith("/") else url
 
-        debug(f"Navigating to URL: {url_with_slash}")
+        if DEBUG:
+            log.debug(f"Navigating to URL: {url_with_slash}")
+
+        try:
+            if sitekey:
+                page_data = self._render_html(sitekey, action, cdata)
+                await page.route(url_with_slash, lambda route: route.fulfill(body=page_data, status=200))
+
+            await page.goto(url_with_slash, timeout=self.navigation_timeout_ms)
+        except BaseException:
+            await page.close()
+            raise
 
-        if sitekey:
-            turnstile_div = f'<div class="cf-turnstile" data-sitekey="{sitekey}"' + (f' data-action="{action}"' if action else '') + (f' data-cdata="{cdata}"' if cdata else '') + ' data-theme="light"></div>'
-            page_data = self.HTML_TEMPLATE.replace("<!-- cf turnstile -->", turnstile_div)
-            await page.route(url_with_slash, lambda route: route.fulfill(body=page_data, status=200))
-        
-        await page.goto(url_with_slash)
         return page
 
-    @debug
     async def _get_turnstile_response(self, page: Page, max_attempts: int = 10, invisible: bool = False) -> Optional[str]:
-        """Attempt to retrieve Turnstile response."""
-        attempts = 0
+        """Return the token once the widget mounts and fills it in; visible widgets are clicked on every 500 ms slice."""
+        attempts, timeout = (1, max_attempts * 500) if invisible else (max_attempts, 500)
 
-        while attempts < max_attempts:
-            turnstile_check = await page.eval_on_selector(
-                "[name=cf-turnstile-response]", 
-                "el => el.value"
-            )
+        try:
+            await page.wait_for_selector("[name=cf-turnstile-response]", state="attached", timeout=5000)
+        except PlaywrightTimeoutError:
+            if DEBUG:
+                log.debug("Turnstile widget did not mount within 5000 ms.")
+            return None
+
+        for attempt in range(attempts):
+            if not invisible:
+                await page.click(".cf-turnstile")
+
+            try:
+                handle = await page.wait_for_function(
+                    """() => {
+                        const el = document.querySelector('[name=cf-turnstile-response]');
+                        return el && el.value ? el.value : false;
+                    }""",
+                    timeout=timeout
+                )
+                return await handle.json_value()
+            except PlaywrightTimeoutError:
+                if DEBUG:
+                    log.debug(f"Attempt {attempt + 1}: No Turnstile response yet.")
 
-            if turnstile_check == "":
-                debug(f"Attempt {attempts + 1}: No Turnstile response yet.")
+        return None
 
-                if not invisible:
-                    await page.evaluate("document.querySelector('.cf-turnstile').style.width = '70px'")
-                    await page.click(".cf-turnstile")
+    def _acquire_profile(self) -> tuple:
+        """Take a previously used profile dir for this browser type, or create a new one, and say which."""
+        free_profiles = self._free_profiles.setdefault(self.browser_type, [])
+        if free_profiles:
+            return free_profiles.pop(), True
+
+        os.makedirs(PROFILES_ROOT, exist_ok=True)
+        profile_prefix = "edge" if self.browser_type == "msedge" else self.browser_type
+        return tempfile.mkdtemp(prefix=f"turnstile-{profile_prefix}-", dir=PROFILES_ROOT), False
+
+    async def _launch_camoufox(self):
+        """Launch a Camoufox browser."""
+        return await AsyncCamoufox(headless=self.headless).start()
+
+    async def _launch_chromium(self):
+        """Launch a bundled Chromium browser."""
+        self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=self.browser_args
+        )
 
-                await asyncio.sleep(0.5)
-                attempts += 1
-            else:
-                turnstile_element = await page.query_selector("[name=cf-turnstile-response]")
-                if turnstile_element:
-                    return await turnstile_element.get_attribute("value")
+    async def _launch_persistent(self):
+        """Launch an installed Chrome or Edge channel with a persistent profile."""
+        self._playwright = await async_playwright().start()
+        self._profile_dir, reused = self._acquire_profile()
+        context = await self._playwright.chromium.launch_persistent_context(
+            user_data_dir=self._profile_dir,
+            channel=self.browser_type,
+            headless=self.headless,
+            no_viewport=True,
+        )
+        if reused:
+            await context.clear_cookies()
+        return context
+
+    _LAUNCHERS = {
+        "chromium": _launch_chromium,
+        "chrome": _launch_persistent,
+        "msedge": _launch_persistent,
+        "camoufox": _launch_camoufox,
+    }
+
+    async def _ensure_browser(self):
+        """Launch the shared browser on first use and return it."""
+        async with self._browser_lock:
+            if self._browser is None:
+                self._browser = await self._LAUNCHERS[self.browser_type](self)
+                if DEBUG:
+                    log.debug(f"Launched shared {self.browser_type} browser.")
+            return self._browser
+
+    async def _new_context(self, url: str, invisible: bool = False, cookies: dict = None):
+        """Return a context for one solve and whether the solve owns it."""
+        browser = await self._ensure_browser()
+
+        if self.browser_type in ("chrome", "msedge"):
+            return browser, False
+
+        if invisible and not cookies:
+            context_key = (urlsplit(url).netloc, self.useragent)
+            context = self._contexts.get(context_key)
+            if context is None:
+                context = await browser.new_context()
+                existing = self._contexts.setdefault(context_key, context)
+                if existing is not context:
+                    await context.close()
+                    context = existing
+            return context, False
+
+        return await browser.new_context(), True
+
+    async def close(self) -> None:
+        """Close the shared contexts and browser and stop playwright."""
+        for context in self._contexts.values():
+            await context.close()
+        self._contexts.clear()
+
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+        if self._profile_dir is not None:
+            self._free_profiles[self.browser_type].append(self._profile_dir)
+            self._profile_dir = None
+        self._persistent_cookies = None
+
+        debug("Browser closed.")
+
+    async def _release(self) -> None:
+        """Close the browser once the last solve finishes, unless the solver is held open with async with."""
+        self._active -= 1
+        # Held so a solve starting meanwhile waits in _ensure_browser and relaunches instead of using a closing browser
+        async with self._browser_lock:
+            if not self._active and not self._warm:
+                await self.close()
+
+    async def __aenter__(self):
+        self._warm = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._warm = False
+        await self.close()
+
+    @classmethod
+    def _store_token(cls, cache_key: str, token: str) -> None:
+        """Cache a fresh token and drop the ones that have expired."""
+        now = time.monotonic()
+        cache = cls._token_cache
+        cache.pop(cache_key, None)
+        while cache:
+            oldest = next(iter(cache))
+            if now - cache[oldest][1] < cls.TOKEN_CACHE_TTL:
                 break
+            del cache[oldest]
+        cache[cache_key] = (token, now)
 
-        return None
+    def _build_result(self, turnstile_value: Optional[str], start_time: float) -> TurnstileResult:
+        """Build the TurnstileResult for a finished solve and log it."""
+        elapsed_time = round(time.monotonic() - start_time, 3)
+
+        if not turnstile_value:
+            log.failure("Failed to retrieve Turnstile value.")
+            return TurnstileResult(
+                turnstile_value=None,
+                elapsed_time_seconds=elapsed_time,
+                status="failure",
+                reason="Max attempts reached without token retrieval"
+            )
+
+        if self.show_spinner:
+            self.loader.stop()
+        log.message(
+            "Cloudflare",
+            f"Successfully solved captcha: {turnstile_value[:45]}...",
+            start=start_time,
+            end=time.monotonic()
+        )
+        return TurnstileResult(
+            turnstile_value=turnstile_value,
+            elapsed_time_seconds=elapsed_time,
+            status="success"
+        )
 
     async def solve(self, url: str, sitekey: str = None, invisible: bool = False, cookies: dict = None, 
                    action: str = None, cdata: str = None) -> TurnstileResult:
@@ -149,199 +346,75 @@ class AsyncTurnstileSolver:
         Returns:
             TurnstileResult object containing the solution details
         """
-        self.loader.start()
-        start_time = time.time()
+        self._active += 1
+        try:
+            return await self._solve(url, sitekey, invisible, cookies, action, cdata)
+        finally:
+            await self._release()
+
+    async def _solve(self, url: str, sitekey: str, invisible: bool, cookies: Optional[dict],
+                     action: Optional[str], cdata: Optional[str]) -> TurnstileResult:
+        """Run one solve on the shared browser."""
+        cache_key = None
+        if self.cache_policy != "disabled":
+            cache_key = hashlib.sha256(f"{url}|{sitekey}|{action}|{cdata}".encode()).hexdigest()
+            cached = self._token_cache.pop(cache_key, None)
+            if cached:
+                token, issued_at = cached
+                if time.monotonic() - issued_at < self.TOKEN_CACHE_TTL:
+                    debug("Returning cached Turnstile token.")
+                    return TurnstileResult(turnstile_value=token, elapsed_time_seconds=0.0, status="success")
+
+        if self.show_spinner:
+            self.loader.start()
+        start_time = time.monotonic()
 
         try:
-            if self.browser_type == "chromium":
-                playwright = await async_playwright().start()
-                browser = await playwright.chromium.launch(
-                    headless=self.headless,
-                    args=self.browser_args
-                )
-                context = await browser.new_context()
+            context, owns_context = await self._new_context(url, invisible, cookies)
+
+            page = None
+            try:
+                if self.browser_type in ("chrome", "msedge") and cookies != self._persistent_cookies:
+                    await context.clear_cookies()
+                    self._persistent_cookies = cookies
 
                 if cookies:
-                    domain = url.split("//")[-1].split("/")[0]
-                    cookie_list = []
-                    for name, value in cookies.items():
-                        cookie_list.append({
-                            "name": name,
-                            "value": str(value),
-                            "domain": domain,
-                            "path": "/"
-                        })
-                    if cookie_list:
-                        await context.add_cookies(cookie_list)
+                    domain = urlsplit(url).netloc
+                    await context.add_cookies([
+                        {"name": name, "value": str(value), "domain": domain, "path": "/"}
+                        for name, value in cookies.items()
+                    ])
 
+                page = await self._setup_page(context, url, sitekey, action, cdata)
                 try:
-                    page = await self._setup_page(context, url, sitekey, action, cdata)
-                    turnstile_value = await self._get_turnstile_response(page, invisible=invisible)
-
-                    elapsed_time = round(time.time() - start_time, 3)
-
-                    if not turnstile_value:
-                        result = TurnstileResult(
-                            turnstile_value=None,
-                            elapsed_time_seconds=elapsed_time,
-                            status="failure",
-                            reason="Max attempts reached without token retrieval"
-                        )
-                        self.log.failure("Failed to retrieve Turnstile value.")
-                    else:
-                        result = TurnstileResult(
-                            turnstile_value=turnstile_value,
-                            elapsed_time_seconds=elapsed_time,
-                            status="success"
-                        )
-                        self.loader.stop()
-                        self.log.message(
-                            "Cloudflare",
-                            f"Successfully solved captcha: {turnstile_value[:45]}...",
-                            start=start_time,
-                            end=time.time()
-                        )
-
-                finally:
+                    turnstile_value = await asyncio.wait_for(
+                        self._get_turnstile_response(page, invisible=invisible),
+                        timeout=self.poll_timeout_ms / 1000
+                    )
+                except asyncio.TimeoutError:
+                    if DEBUG:
+                        log.debug(f"Turnstile response retrieval exceeded {self.poll_timeout_ms} ms.")
+                    turnstile_value = None
+
+                if DEBUG:
+                    log.debug(f"_get_turnstile_response returned: {turnstile_value}")
+
+                result = self._build_result(turnstile_value, start_time)
+                if result.status == "success" and self.cache_policy == "enabled":
+                    self._store_token(cache_key, turnstile_value)
+
+            finally:
+                if owns_context:
                     await context.close()
-                    await browser.close()
-                    await playwright.stop()
-                    
-                    debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
-                    debug("Browser closed. Returning result.")
-
-            elif self.browser_type == "chrome":
-                playwright = await async_playwright().start()
-                browser = await playwright.chromium.launch_persistent_context(
-                    user_data_dir=f"{os.getcwd()}/tmp/turnstile-chrome-{''.join(random.choices(string.ascii_letters + string.digits, k=10))}",
-                    channel="chrome",
-                    headless=self.headless,
-                    no_viewport=True,
-                )
+                elif page is not None:
+                    await page.close()
 
-                try:
-                    page = await self._setup_page(browser, url, sitekey, action, cdata)
-                    turnstile_value = await self._get_turnstile_response(page, invisible=invisible)
-
-                    elapsed_time = round(time.time() - start_time, 3)
-
-                    if not turnstile_value:
-                        result = TurnstileResult(
-                            turnstile_value=None,
-                            elapsed_time_seconds=elapsed_time,
-                            status="failure",
-                            reason="Max attempts reached without token retrieval"
-                        )
-                        self.log.failure("Failed to retrieve Turnstile value.")
-                    else:
-                        result = TurnstileResult(
-                            turnstile_value=turnstile_value,
-                            elapsed_time_seconds=elapsed_time,
-                            status="success"
-                        )
-                        self.loader.stop()
-                        self.log.message(
-                            "Cloudflare",
-                            f"Successfully solved captcha: {turnstile_value[:45]}...",
-                            start=start_time,
-                            end=time.time()
-                        )
-
-                finally:
-                    await browser.close()
-                    await playwright.stop()
-                    
-                    debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
-                    debug("Browser closed. Returning result.")
-
-            elif self.browser_type == "msedge":
-                playwright = await async_playwright().start()
-                browser = await playwright.chromium.launch_persistent_context(
-                    user_data_dir=f"{os.getcwd()}/tmp/turnstile-edge-{''.join(random.choices(string.ascii_letters + string.digits, k=10))}",
-                    channel="msedge",
-                    headless=self.headless,
-                    no_viewport=True,
-                )
-
-                try:
-                    page = await self._setup_page(browser, url, sitekey, action, cdata)
-                    turnstile_value = await self._get_turnstile_response(page, invisible=invisible)
-
-                    elapsed_time = round(time.time() - start_time, 3)
-
-                    if not turnstile_value:
-                        result = TurnstileResult(
-                            turnstile_value=None,
-                            elapsed_time_seconds=elapsed_time,
-                            status="failure",
-                            reason="Max attempts reached without token retrieval"
-                        )
-                        self.log.failure("Failed to retrieve Turnstile value.")
-                    else:
-                        result = TurnstileResult(
-                            turnstile_value=turnstile_value,
-                            elapsed_time_seconds=elapsed_time,
-                            status="success"
-                        )
-                        self.loader.stop()
-                        self.log.message(
-                            "Cloudflare",
-                            f"Successfully solved captcha: {turnstile_value[:45]}...",
-                            start=start_time,
-                            end=time.time()
-                        )
-
-                finally:
-                    await browser.close()
-                    await playwright.stop()
-                    
-                    debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
-                    debug("Browser closed. Returning result.")
-
-            elif self.browser_type == "camoufox":
-                browser = await AsyncCamoufox(headless=self.headless).start()
-
-                try:
-                    page = await self._setup_page(browser, url, sitekey, action, cdata)
-                    turnstile_value = await self._get_turnstile_response(page, invisible=invisible)
-
-                    elapsed_time = round(time.time() - start_time, 3)
-
-                    if not turnstile_value:
-                        result = TurnstileResult(
-                            turnstile_value=None,
-                            elapsed_time_seconds=elapsed_time,
-                            status="failure",
-                            reason="Max attempts reached without token retrieval"
-                        )
-                        self.log.failure("Failed to retrieve Turnstile value.")
-                    else:
-                        result = TurnstileResult(
-                            turnstile_value=turnstile_value,
-                            elapsed_time_seconds=elapsed_time,
-                            status="success"
-                        )
-                        self.loader.stop()
-                        self.log.message(
-                            "Cloudflare",
-                            f"Successfully solved captcha: {turnstile_value[:45]}...",
-                            start=start_time,
-                            end=time.time()
-                        )
-
-                finally:
-                    await browser.close()
-                    try:
-                        await browser.stop()
-                    except:
-                        pass
-                    
-                    debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
-                    debug("Browser closed. Returning result.")
+                debug("Context closed. Returning result.")
 
         except Exception as e:
-            elapsed_time = round(time.time() - start_time, 3)
-            self.loader.stop()
+            elapsed_time = round(time.monotonic() - start_time, 3)
+            if self.show_spinner:
+                self.loader.stop()
             return TurnstileResult(
                 turnstile_value=None,
                 elapsed_time_seconds=elapsed_time,
@@ -349,19 +422,47 @@ class AsyncTurnstileSolver:
                 reason=str(e)
             )
 
+        if DEBUG:
+            log.debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
         return result
 
-@debug
+    async def solve_many(self, jobs: List[Dict], concurrency: int = 8) -> List[TurnstileResult]:
+        """
+        Solve several Turnstile challenges concurrently on the shared browser.
+
+        Args:
+            jobs: List of keyword-argument dicts accepted by solve()
+            concurrency: Maximum number of solves running at once
+
+        Returns:
+            List of TurnstileResult objects in the same order as jobs
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(job: Dict) -> TurnstileResult:
+            async with semaphore:
+                return await self.solve(**job)
+
+        self._active += 1
+        try:
+            return await asyncio.gather(*(run(job) for job in jobs))
+        finally:
+            await self._release()
+
+def _get_solve_semaphore() -> asyncio.Semaphore:
+    """Return the get_turnstile_token concurrency limit for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _solve_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _solve_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_SOLVES)
+    return semaphore
+
 async def get_turnstile_token(headless: bool = False, url: str = None, sitekey: str = None, invisible: bool = False, 
                              cookies: dict = None, user_agent: str = None, debug: bool = True, browser_type: str = "chromium",
-                             action: str = None, cdata: str = None) -> Dict:
+                             action: str = None, cdata: str = None, cache_policy: str = "disabled",
+                             show_spinner: bool = False) -> Dict:
     """Legacy wrapper function for backward compatibility."""
-    browser_types = [
-        'chromium',
-        'chrome',
-        'camoufox',
-        'msedge',
-    ]
+    browser_types = list(AsyncTurnstileSolver._LAUNCHERS)
     if browser_type not in browser_types:
         log.error(f"Unknown browser type: {browser_type} Available browser types: {browser_types}")
         return {"status": "error", "error": f"Unknown browser type: {browser_type}"}
@@ -369,16 +470,21 @@ async def get_turnstile_token(headless: bool = False, url: str = None, sitekey:
         log.error(f"You must specify a User-Agent for Turnstile Solver or use camoufox without useragent")
         return {"status": "error", "error": "Headless mode requires a useragent"}
     
-    solver = AsyncTurnstileSolver(headless=headless, useragent=user_agent, debug=debug, browser_type=browser_type)
-    result = await solver.solve(
-        url=url, 
-        sitekey=sitekey, 
-        invisible=invisible, 
-        cookies=cookies,
-        action=action,
-        cdata=cdata
-    )
-    return result.__dict__
+    async with _get_solve_semaphore():
+        async with AsyncTurnstileSolver(headless=headless, useragent=user_agent, debug=debug, browser_type=browser_type,
+                                        cache_policy=cache_policy, show_spinner=show_spinner) as solver:
+            result = await solver.solve(
+                url=url, 
+                sitekey=sitekey, 
+                invisible=invisible, 
+                cookies=cookies,
+                action=action,
+                cdata=cdata
+            )
+    result_dict = asdict(result)
+    if DEBUG:
+        log.debug(f"get_turnstile_token returned: {result_dict}")
+    return result_dict
 
 if __name__ == "__main__":
     async def main():
@@ -387,10 +493,13 @@ if __name__ == "__main__":
             sitekey="0x4AAAAAAACELUBpqiwktdQ9",
             invisible=True,
             browser_type="chromium",
-            debug=True
+            debug=True,
+            show_spinner=True
         )
         print(result)
 
+    install_uvloop()
+
     asyncio.run(main())
 
 # Credits for the changes: github.com/sexfrance
@@ -0,0 +1,9 @@
+import asyncio
+
+def install_uvloop() -> None:
+    """Switch asyncio to uvloop's event loop policy when uvloop is installed (it is not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -7,6 +7,7 @@ from api_solver import create_app
 from sync_solver import get_turnstile_token as sync_solve
 from async_solver import get_turnstile_token as async_solve
 from logmagix import Logger, Loader
+from event_loop import install_uvloop
 class TurnstileTester:
     def __init__(self):
         self.log = Logger(github_repository="https://github.com/sexfrance/Turnstile-Solver")
@@ -44,7 +45,7 @@ class TurnstileTester:
 
         def sync_task():
             try:
-                result = sync_solve(url=url, sitekey=sitekey, headless=False)
+                result = sync_solve(url=url, sitekey=sitekey, headless=False, show_spinner=True)
                 if result.get('status') == 'success':
                     self.log.success("Sync solver completed successfully")
                 else:
@@ -63,7 +64,7 @@ class TurnstileTester:
         """Run the asynchronous solver with logging."""
         self.log.debug(f"Starting async solver for {url}")
         try:
-            result = await async_solve(url=url, sitekey=sitekey, headless=False)
+            result = await async_solve(url=url, sitekey=sitekey, headless=False, show_spinner=True)
             if result.get('status') == 'success':
                 self.log.success("Async solver completed successfully")
             else:
@@ -123,6 +124,8 @@ class TurnstileTester:
 
 
 if __name__ == "__main__":
+    install_uvloop()
+
     tester = TurnstileTester()
     asyncio.run(tester.main())
 
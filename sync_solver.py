@@ -1,17 +1,25 @@
 import time
 import os
-import random
-import string
-
-from typing import Dict, Optional
-from dataclasses import dataclass
-from patchright.sync_api import sync_playwright, Page, BrowserContext
+import re
+import urllib.request
+import threading
+import weakref
+import secrets
+
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, asdict
+from patchright.sync_api import sync_playwright, Page, BrowserContext, TimeoutError as PlaywrightTimeoutError
 from camoufox.sync_api import Camoufox
 from logmagix import Loader
-from functools import wraps
+from functools import wraps, lru_cache, cached_property
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 from .logger import log
 
 DEBUG = False
+PROFILES_ROOT = f"{os.getcwd()}/tmp"
+API_JS_PATTERN = re.compile(r"^https://challenges\.cloudflare\.com/turnstile/v0/api\.js(\?|$)")
 
 def set_debug(value: bool):
     global DEBUG
@@ -31,13 +39,84 @@ def debug(func_or_message, *args, **kwargs):
         if DEBUG:
             log.debug(f"Debug: {func_or_message}")
 
-@dataclass
+@dataclass(slots=True)
 class TurnstileResult:
     turnstile_value: Optional[str]
     elapsed_time_seconds: float
     status: str
     reason: Optional[str] = None
 
+class _IdleSlot:
+    """Holds a thread's idle pool entry; it is dropped with the thread's locals when the thread exits."""
+    __slots__ = ("entry", "finalizer", "__weakref__")
+
+    def __init__(self, entry: dict):
+        self.entry = entry
+        self.finalizer = weakref.finalize(self, log.warning, "A thread exited without closing its warm browser; call TurnstileSolver.close() on it")
+        self.finalizer.atexit = False
+
+class BrowserPool:
+    """Keeps launched browsers warm between solves, up to `size` idle browsers."""
+
+    def __init__(self, launch: Callable[[], Any], size: int = 4, max_uses: int = 50):
+        self._launch = launch
+        self.size = size
+        self.max_uses = max_uses
+        # Playwright sync objects are bound to the thread that created them, so idle browsers are kept per thread
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._idle = weakref.WeakSet()
+
+    def _take_idle(self) -> Optional[dict]:
+        """Remove and return the calling thread's idle entry, if any."""
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            return None
+        self._local.slot = None
+        slot.finalizer.detach()
+        with self._lock:
+            self._idle.discard(slot)
+        return slot.entry
+
+    @contextmanager
+    def acquire(self):
+        """Yield a warm pool entry for this thread, launching a browser if none is idle."""
+        entry = self._take_idle()
+        if entry is None:
+            entry = {"browser": self._launch(), "uses": 0}
+
+        healthy = False
+        try:
+            yield entry
+            healthy = True
+        finally:
+            entry["uses"] += 1
+            slot = None
+            if healthy and entry["uses"] < self.max_uses and getattr(self._local, "slot", None) is None:
+                with self._lock:
+                    if len(self._idle) < self.size:
+                        slot = _IdleSlot(entry)
+                        self._idle.add(slot)
+
+            if slot is not None:
+                self._local.slot = slot
+            else:
+                self._retire(entry)
+
+    @staticmethod
+    def _retire(entry: dict) -> None:
+        """Close a browser that is worn out, broken or surplus."""
+        try:
+            entry["browser"].close()
+        except Exception as e:
+            log.failure(f"Error closing browser: {str(e)}")
+
+    def close(self) -> None:
+        """Close the idle browser kept by the calling thread."""
+        entry = self._take_idle()
+        if entry is not None:
+            self._retire(entry)
+
 class TurnstileSolver:
     HTML_TEMPLATE = """
     <!DOCTYPE html>
@@ -58,22 +137,39 @@ class TurnstileSolver:
     </html>
     """
 
-    def __init__(self, debug: bool = False, headless: Optional[bool] = None, useragent: Optional[str] = None, browser_type: str = "chromium"):
+    CONTEXT_MAX_USES = 10
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+    _free_profiles: Dict[str, List[str]] = {}
+    _profiles_lock = threading.Lock()
+    API_JS_URL = "https://challenges.cloudflare.com/turnstile/v0/api.js"
+    API_JS_TTL = 3600
+    _api_js: Optional[bytes] = None
+    _api_js_fetched_at = 0.0
+    _api_js_lock = threading.Lock()
+
+    def __init__(self, debug: bool = False, headless: Optional[bool] = None, useragent: Optional[str] = None, browser_type: str = "chromium",
+                 pool_size: int = 4, max_uses_per_instance: int = 50, show_spinner: bool = False):
         self.debug = debug
         self.browser_type = browser_type
         self.headless = headless if headless is not None else False
         self.useragent = useragent
         self.log = log
-        self.loader = Loader(desc="Solving captcha...", timeout=0.05)
-        
+        self.show_spinner = show_spinner
+        self._thread_local = threading.local()
+        self._warm = False
+        self.pool = BrowserPool(self._launch_browser, size=pool_size, max_uses=max_uses_per_instance)
+        self._refresh_api_js()
+
         self.browser_args = [
             "--disable-blink-features=AutomationControlled",
             "--no-sandbox",
             "--disable-dev-shm-usage",
-            "--disable-background-networking",
-            "--disable-background-timer-throttling",
+            "--disable-gpu",
+            "--disable-software-rasterizer",
+            "--renderer-process-limit=1",
+            "--js-flags=--max-old-space-size=256",
+            # The window is parked off-screen, which would otherwise count as occluded and get throttled
             "--disable-backgrounding-occluded-windows",
-            "--disable-renderer-backgrounding",
             "--window-position=2000,2000",
         ]
 
@@ -82,58 +178,212 @@ class TurnstileSolver:
 
         if self.headless and not self.useragent:
             self.log.warning("To solve captchas with headless mode you need to set the useragent!")
+
+    @cached_property
+    def loader(self) -> Loader:
+        """Loader spinner, only built once a show_spinner solve starts."""
+        return Loader(desc="Solving captcha...", timeout=0.05)
  
 
-    @debug
-    def _setup_page(self, browser, url: str, sitekey: str = None, action: str = None, cdata: str = None) -> Page:
+    def _setup_page(self, context: BrowserContext, url_with_slash: str, sitekey: str = None, action: str = None, cdata: str = None) -> Page:
         """Set up the page with or without Turnstile widget."""
-        if self.browser_type == "chrome":
-            page = browser.pages[0]
-        else:
-            page = browser.new_page()
-            
-        url_with_slash = url + "/" if not url.endswith("/") else url
-        
-        debug(f"Navigating to URL: {url_with_slash}")
+        page = context.new_page()
+
+        if DEBUG:
+            log.debug(f"Navigating to URL: {url_with_slash}")
 
         if sitekey:
-            turnstile_div = f'<div class="cf-turnstile" data-sitekey="{sitekey}"' + (f' data-action="{action}"' if action else '') + (f' data-cdata="{cdata}"' if cdata else '') + ' data-theme="light"></div>'
-            page_data = self.HTML_TEMPLATE.replace("<!-- cf turnstile -->", turnstile_div)
-            page.route(url_with_slash, lambda route: route.fulfill(body=page_data, status=200))
+            page_data = _build_page_html(sitekey, action, cdata)
+            # Turnstile validates the page origin, so the HTML must be served on the real URL;
+            # the route only has to answer the initial navigation and then removes itself
+            page.route(url_with_slash, lambda route: route.fulfill(body=page_data, status=200), times=1)
         
         page.goto(url_with_slash)
         return page
 
-    @debug
     def _get_turnstile_response(self, page: Page, max_attempts: int = 10, invisible: bool = False) -> Optional[str]:
-        """Attempt to retrieve Turnstile response."""
-        attempts = 0
+        """Wait for the Turnstile response, re-clicking visible widgets between waits."""
+        attempts, timeout = (1, max_attempts * 500) if invisible else (max_attempts, 500)
 
-        while attempts < max_attempts:
-            turnstile_check = page.eval_on_selector(
-                "[name=cf-turnstile-response]", 
-                "el => el.value"
-            )
+        try:
+            page.wait_for_selector("[name=cf-turnstile-response]", state="attached", timeout=5000)
+        except PlaywrightTimeoutError:
+            if DEBUG:
+                log.debug("Turnstile widget did not mount within 5000 ms.")
+            return None
+
+        for attempt in range(attempts):
+            if not invisible:
+                page.click(".cf-turnstile")
+
+            try:
+                handle = page.wait_for_function(
+                    """() => {
+                        const el = document.querySelector('[name=cf-turnstile-response]');
+                        return el && el.value ? el.value : false;
+                    }""",
+                    timeout=timeout
+                )
+                return handle.json_value()
+            except PlaywrightTimeoutError:
+                if DEBUG:
+                    log.debug(f"Attempt {attempt + 1}: No Turnstile response yet.")
+
+        return None
+
+    def _playwright(self):
+        """Return the Playwright driver for the calling thread, starting it on first use."""
+        playwright = getattr(self._thread_local, "playwright", None)
+        if playwright is None:
+            playwright = self._thread_local.playwright = sync_playwright().start()
+        return playwright
+
+    def _launch_camoufox(self):
+        """Launch a Camoufox browser."""
+        return Camoufox(headless=self.headless).start()
+
+    def _launch_chromium(self):
+        """Launch a bundled Chromium browser."""
+        return self._playwright().chromium.launch(headless=self.headless, args=self.browser_args)
+
+    def _acquire_profile(self) -> tuple:
+        """Take a previously used profile dir for this browser type, or name a new one."""
+        with self._profiles_lock:
+            free_profiles = self._free_profiles.setdefault(self.browser_type, [])
+            if free_profiles:
+                return free_profiles.pop(), True
+
+        prefix = "edge" if self.browser_type == "msedge" else self.browser_type
+        return f"{PROFILES_ROOT}/turnstile-{prefix}-{secrets.token_hex(5)}", False
+
+    def _release_profile(self, profile_dir: str) -> None:
+        """Hand a closed browser's profile dir back for reuse."""
+        with self._profiles_lock:
+            self._free_profiles.setdefault(self.browser_type, []).append(profile_dir)
+
+    def _launch_persistent(self):
+        """Launch installed Chrome or Edge as a persistent context, which doubles as the browser."""
+        # Chrome locks its profile while running, so each live browser needs its own dir; closed ones are recycled
+        profile_dir, reused = self._acquire_profile()
+        context = self._playwright().chromium.launch_persistent_context(
+            user_data_dir=profile_dir,
+            channel=self.browser_type,
+            headless=self.headless,
+            no_viewport=True,
+        )
+        context.on("close", lambda _: self._release_profile(profile_dir))
+        if reused:
+            context.clear_cookies()
+        return self._install_routes(context)
+
+    _LAUNCHERS = {
+        "chromium": _launch_chromium,
+        "chrome": _launch_persistent,
+        "msedge": _launch_persistent,
+        "camoufox": _launch_camoufox,
+    }
+
+    def _launch_browser(self):
+        """Launch a browser for the configured browser type on the calling thread."""
+        return self._LAUNCHERS[self.browser_type](self)
+
+    @classmethod
+    def _refresh_api_js(cls) -> None:
+        """Refetch Turnstile's api.js once the shared copy is older than API_JS_TTL."""
+        if cls._api_js is not None and time.monotonic() - cls._api_js_fetched_at < cls.API_JS_TTL:
+            return
+
+        if not cls._api_js_lock.acquire(blocking=cls._api_js is None):
+            return
+        try:
+            if cls._api_js is None or time.monotonic() - cls._api_js_fetched_at >= cls.API_JS_TTL:
+                try:
+                    with urllib.request.urlopen(cls.API_JS_URL, timeout=10) as response:
+                        cls._api_js = response.read()
+                except Exception as e:
+                    log.failure(f"Error fetching Turnstile api.js: {str(e)}")
+                cls._api_js_fetched_at = time.monotonic()
+        finally:
+            cls._api_js_lock.release()
+
+    def _serve_api_js(self, route) -> None:
+        """Fulfill api.js from the shared copy, or let it through if no copy could be fetched."""
+        body = self._api_js
+        if body is None:
+            route.continue_()
+        else:
+            route.fulfill(body=body, status=200, content_type="application/javascript; charset=utf-8")
+
+    def _install_routes(self, context: BrowserContext) -> BrowserContext:
+        """Install the context-wide routes once: block unneeded resources and serve the cached api.js."""
+        blocked = self.BLOCKED_RESOURCE_TYPES
+        context.route("**/*", lambda route: route.abort() if route.request.resource_type in blocked else route.continue_())
+        # Registered last so it is matched before the catch-all route above
+        context.route(API_JS_PATTERN, self._serve_api_js)
+        return context
+
+    @contextmanager
+    def _launch_ctx(self, cookies: dict = None):
+        """Yield a context on a pooled browser, reusing it for up to CONTEXT_MAX_USES solves."""
+        self._refresh_api_js()
+        with self.pool.acquire() as entry:
+            persistent = self.browser_type in ("chrome", "msedge")
+            context = entry["browser"] if persistent else entry.get("context")
+            if context is None:
+                context = entry["context"] = self._install_routes(entry["browser"].new_context())
+                entry["context_uses"] = 0
+            elif entry.get("cookies") != cookies:
+                context.clear_cookies()
+                context.clear_permissions()
+            entry["cookies"] = cookies
+
+            pages_before = set(context.pages)
+            try:
+                yield context
+            finally:
+                try:
+                    for page in context.pages:
+                        if page not in pages_before:
+                            page.close()
+
+                    if not persistent:
+                        entry["context_uses"] += 1
+                        if entry["context_uses"] >= self.CONTEXT_MAX_USES:
+                            entry["context"] = None
+                            context.close()
+                except Exception as e:
+                    entry["context"] = None
+                    self.log.failure(f"Error closing context: {str(e)}")
 
-            if turnstile_check == "":
-                
-                debug(f"Attempt {attempts + 1}: No Turnstile response yet.")
+                debug("Pages closed. Returning result.")
 
-                if not invisible:
-                    page.evaluate("document.querySelector('.cf-turnstile').style.width = '70px'")
-                    page.click(".cf-turnstile")
+    def _build_result(self, turnstile_value: Optional[str], start_time: float) -> TurnstileResult:
+        """Wrap the retrieved token, or its absence, in a TurnstileResult."""
+        elapsed_time = round(time.time() - start_time, 3)
 
-                time.sleep(0.5)
-                attempts += 1
-            else:
-                turnstile_element = page.query_selector("[name=cf-turnstile-response]")
-                if turnstile_element:
-                    return turnstile_element.get_attribute("value")
-                break
+        if not turnstile_value:
+            self.log.failure("Failed to retrieve Turnstile value.")
+            return TurnstileResult(
+                turnstile_value=None,
+                elapsed_time_seconds=elapsed_time,
+                status="failure",
+                reason="Max attempts reached without token retrieval"
+            )
 
-        return None
+        if self.show_spinner:
+            self.loader.stop()
+        self.log.message(
+            "Cloudflare",
+            f"Successfully solved captcha: {turnstile_value[:45]}...",
+            start=start_time,
+            end=time.time()
+        )
+        return TurnstileResult(
+            turnstile_value=turnstile_value,
+            elapsed_time_seconds=elapsed_time,
+            status="success"
+        )
 
-    @debug
     def solve(self, url: str, sitekey: str = None, invisible: bool = False, cookies: dict = None, action: str = None, cdata: str = None) -> TurnstileResult:
         """
         Solve the Turnstile challenge and return the result.
@@ -150,217 +400,42 @@ class TurnstileSolver:
             TurnstileResult object containing the solution details
         """
         
-        self.loader.start()
+        if self.show_spinner:
+            self.loader.start()
         start_time = time.time()
 
         try:
-            if self.browser_type == "chromium":
-                with sync_playwright() as playwright:
-                    browser = playwright.chromium.launch(headless=self.headless, args=self.browser_args)
-                    context = browser.new_context()
-                    
-                    if cookies:
-                        domain = url.split("//")[-1].split("/")[0]
-                        cookie_list = []
-                        for name, value in cookies.items():
-                            cookie_list.append({
-                                "name": name,
-                                "value": str(value),
-                                "domain": domain,
-                                "path": "/"
-                            })
-                        if cookie_list:
-                            context.add_cookies(cookie_list)
-
-                    try:
-                        page = self._setup_page(context, url, sitekey, action, cdata)
-                        turnstile_value = self._get_turnstile_response(page, invisible=invisible)
-                        
-                        elapsed_time = round(time.time() - start_time, 3)
-
-                        if not turnstile_value:
-                            result = TurnstileResult(
-                                turnstile_value=None,
-                                elapsed_time_seconds=elapsed_time,
-                                status="failure",
-                                reason="Max attempts reached without token retrieval"
-                            )
-                            self.log.failure("Failed to retrieve Turnstile value.")
-                        else:
-                            result = TurnstileResult(
-                                turnstile_value=turnstile_value,
-                                elapsed_time_seconds=elapsed_time,
-                                status="success"
-                            )
-                            self.loader.stop()
-                            self.log.message(
-                                "Cloudflare",
-                                f"Successfully solved captcha: {turnstile_value[:45]}...",
-                                start=start_time,
-                                end=time.time()
-                            )
-
-                    except Exception as e:
-                        self.log.failure(f"Error during captcha solving: {str(e)}")
-                        raise
-
-                    finally:
-                        try:
-                            context.close()
-                            browser.close()
-                        except Exception as e:
-                            self.log.failure(f"Error closing browser: {str(e)}")
-
-                        debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
-                        debug("Browser closed. Returning result.")
-
-            elif self.browser_type == "chrome":
-                with sync_playwright() as playwright:
-                    browser = playwright.chromium.launch_persistent_context(
-                        user_data_dir=f"{os.getcwd()}/tmp/turnstile-chrome-{''.join(random.choices(string.ascii_letters + string.digits, k=10))}",
-                        channel="chrome",
-                        headless=self.headless,
-                        no_viewport=True,
-                    )
-                    
-                    try:
-                        page = self._setup_page(browser, url, sitekey, action, cdata)
-                        turnstile_value = self._get_turnstile_response(page, invisible=invisible)
-                        
-                        elapsed_time = round(time.time() - start_time, 3)
-
-                        if not turnstile_value:
-                            result = TurnstileResult(
-                                turnstile_value=None,
-                                elapsed_time_seconds=elapsed_time,
-                                status="failure",
-                                reason="Max attempts reached without token retrieval"
-                            )
-                            self.log.failure("Failed to retrieve Turnstile value.")
-                        else:
-                            result = TurnstileResult(
-                                turnstile_value=turnstile_value,
-                                elapsed_time_seconds=elapsed_time,
-                                status="success"
-                            )
-                            self.loader.stop()
-                            self.log.message(
-                                "Cloudflare",
-                                f"Successfully solved captcha: {turnstile_value[:45]}...",
-                                start=start_time,
-                                end=time.time()
-                            )
-
-                    except Exception as e:
-                        self.log.failure(f"Error during captcha solving: {str(e)}")
-                        raise
-
-                    finally:
-                        try:
-                            browser.close()
-                        except Exception as e:
-                            self.log.failure(f"Error closing browser: {str(e)}")
-
-                        debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
-                        debug("Browser closed. Returning result.")
-                        
-            elif self.browser_type == "msedge":
-                with sync_playwright() as playwright:
-                    browser = playwright.chromium.launch_persistent_context(
-                        user_data_dir=f"{os.getcwd()}/tmp/turnstile-edge-{''.join(random.choices(string.ascii_letters + string.digits, k=10))}",
-                        channel="msedge",
-                        headless=self.headless,
-                        no_viewport=True,
-                    )
-                    
-                    try:
-                        page = self._setup_page(browser, url, sitekey, action, cdata)
-                        turnstile_value = self._get_turnstile_response(page, invisible=invisible)
-                        
-                        elapsed_time = round(time.time() - start_time, 3)
-
-                        if not turnstile_value:
-                            result = TurnstileResult(
-                                turnstile_value=None,
-                                elapsed_time_seconds=elapsed_time,
-                                status="failure",
-                                reason="Max attempts reached without token retrieval"
-                            )
-                            self.log.failure("Failed to retrieve Turnstile value.")
-                        else:
-                            result = TurnstileResult(
-                                turnstile_value=turnstile_value,
-                                elapsed_time_seconds=elapsed_time,
-                                status="success"
-                            )
-                            self.loader.stop()
-                            self.log.message(
-                                "Cloudflare",
-                                f"Successfully solved captcha: {turnstile_value[:45]}...",
-                                start=start_time,
-                                end=time.time()
-                            )
-
-                    except Exception as e:
-                        self.log.failure(f"Error during captcha solving: {str(e)}")
-                        raise
-
-                    finally:
-                        try:
-                            browser.close()
-                        except Exception as e:
-                            self.log.failure(f"Error closing browser: {str(e)}")
-
-                        debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
-                        debug("Browser closed. Returning result.")
-
-            elif self.browser_type == "camoufox":
-                browser = Camoufox(headless=self.headless).start()
-                
-                try:
-                    page = self._setup_page(browser, url, sitekey, action, cdata)
-                    turnstile_value = self._get_turnstile_response(page, invisible=invisible)
-                    
-                    elapsed_time = round(time.time() - start_time, 3)
-
-                    if not turnstile_value:
-                        result = TurnstileResult(
-                            turnstile_value=None,
-                            elapsed_time_seconds=elapsed_time,
-                            status="failure",
-                            reason="Max attempts reached without token retrieval"
-                        )
-                        self.log.failure("Failed to retrieve Turnstile value.")
-                    else:
-                        result = TurnstileResult(
-                            turnstile_value=turnstile_value,
-                            elapsed_time_seconds=elapsed_time,
-                            status="success"
-                        )
-                        self.loader.stop()
-                        self.log.message(
-                            "Cloudflare",
-                            f"Successfully solved captcha: {turnstile_value[:45]}...",
-                            start=start_time,
-                            end=time.time()
-                        )
+            url_with_slash = url if url.endswith("/") else url + "/"
+            domain = urlsplit(url).netloc
+
+            cookie_list = None
+            if cookies:
+                if not all(isinstance(name, str) and name for name in cookies):
+                    raise ValueError("Cookie names must be non-empty strings")
+                cookie_list = [
+                    {"name": name, "value": str(value), "domain": domain, "path": "/"}
+                    for name, value in cookies.items()
+                ]
+
+            with self._launch_ctx(cookies) as target:
+                if cookie_list:
+                    target.add_cookies(cookie_list)
+
+                page = self._setup_page(target, url_with_slash, sitekey, action, cdata)
+                turnstile_value = self._get_turnstile_response(page, invisible=invisible)
+                if DEBUG:
+                    log.debug(f"_get_turnstile_response returned: {turnstile_value}")
+                result = self._build_result(turnstile_value, start_time)
 
-                except Exception as e:
-                    self.log.failure(f"Error during captcha solving: {str(e)}")
-                    raise
-
-                finally:
-                    try:
-                        browser.close()
-                    except Exception as e:
-                        self.log.failure(f"Error closing browser: {str(e)}")
-
-                    debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
-                    debug("Browser closed. Returning result.")
+            if DEBUG:
+                log.debug(f"Elapsed time: {result.elapsed_time_seconds} seconds")
+            return result
 
         except Exception as e:
+            self.log.failure(f"Error during captcha solving: {str(e)}")
             elapsed_time = round(time.time() - start_time, 3)
-            self.loader.stop()
+            if self.show_spinner:
+                self.loader.stop()
             return TurnstileResult(
                 turnstile_value=None,
                 elapsed_time_seconds=elapsed_time,
@@ -368,15 +443,84 @@ class TurnstileSolver:
                 reason=str(e)
             )
 
-        return result
+        finally:
+            if not self._keeps_warm():
+                self._release_thread()
+
+    def solve_many(self, jobs: List[Dict]) -> List[TurnstileResult]:
+        """
+        Solve several Turnstile challenges in parallel, one pooled browser per worker thread.
+
+        Args:
+            jobs: List of keyword-argument dicts accepted by solve()
+
+        Returns:
+            List of TurnstileResult objects in the same order as jobs
+        """
+        results: List[Optional[TurnstileResult]] = [None] * len(jobs)
+        pending = iter(enumerate(jobs))
+        lock = threading.Lock()
+
+        def worker() -> None:
+            self._thread_local.keep_warm = True
+            try:
+                while True:
+                    with lock:
+                        item = next(pending, None)
+                    if item is None:
+                        return
+                    index, job = item
+                    results[index] = self.solve(**job)
+            finally:
+                self._release_thread()
+
+        workers = min(self.pool.size, len(jobs))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            for future in [executor.submit(worker) for _ in range(workers)]:
+                future.result()
+
+        return results
+
+    def _release_thread(self) -> None:
+        """Close the calling thread's idle browser and stop its Playwright driver."""
+        self._thread_local.keep_warm = False
+        self.pool.close()
+        playwright = getattr(self._thread_local, "playwright", None)
+        if playwright is not None:
+            self._thread_local.playwright = None
+            try:
+                playwright.stop()
+            except Exception as e:
+                self.log.failure(f"Error stopping Playwright: {str(e)}")
+
+    def close(self) -> None:
+        """Close this thread's pooled browser and Playwright driver; call it from each thread that solved."""
+        self._release_thread()
+
+    def _keeps_warm(self) -> bool:
+        """Whether browsers stay open between solves: only inside a with block or a solve_many worker."""
+        return self._warm or getattr(self._thread_local, "keep_warm", False)
+
+    def __enter__(self):
+        self._warm = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._warm = False
+        self.close()
+
+@lru_cache(maxsize=256)
+def _build_page_html(sitekey: str, action: str = None, cdata: str = None) -> str:
+    """Build the Turnstile page HTML for the given widget parameters."""
+    turnstile_div = f'<div class="cf-turnstile" data-sitekey="{sitekey}"' + (f' data-action="{action}"' if action else '') + (f' data-cdata="{cdata}"' if cdata else '') + ' data-theme="light" style="width: 70px"></div>'
+    return TurnstileSolver.HTML_TEMPLATE.replace("<!-- cf turnstile -->", turnstile_div)
 
 class ChallengeSolver: #TODO
     pass
 
-@debug
 def get_turnstile_token(headless: bool = False, url: str = None, sitekey: str = None, invisible: bool = False, 
                        cookies: dict = None, user_agent: str = None, debug: bool = False, browser_type: str = "chromium",
-                       action: str = None, cdata: str = None) -> Dict:
+                       action: str = None, cdata: str = None, show_spinner: bool = False) -> Dict:
     """Legacy wrapper function for backward compatibility."""
     browser_types = [
         'chromium',
@@ -391,7 +535,8 @@ def get_turnstile_token(headless: bool = False, url: str = None, sitekey: str =
         log.error(f"You must specify a User-Agent for Turnstile Solver or use camoufox without useragent")
         return {"status": "error", "error": "Headless mode requires a useragent"}
     
-    solver = TurnstileSolver(headless=headless, useragent=user_agent, debug=debug, browser_type=browser_type)
+    solver = TurnstileSolver(headless=headless, useragent=user_agent, debug=debug, browser_type=browser_type,
+                             show_spinner=show_spinner)
     result = solver.solve(
         url=url, 
         sitekey=sitekey, 
@@ -400,7 +545,7 @@ def get_turnstile_token(headless: bool = False, url: str = None, sitekey: str =
         action=action, 
         cdata=cdata
     )
-    return result.__dict__
+    return asdict(result)
 
 if __name__ == "__main__":
     result = get_turnstile_token(
@@ -408,6 +553,7 @@ if __name__ == "__main__":
         sitekey="0x4AAAAAAACELUBpqiwktdQ9",
         invisible=True,
         browser_type="chromium",
-        debug=True
+        debug=True,
+        show_spinner=True
     )
     print(result)
\ No newline at end of file